@@ -12,40 +12,34 @@ import logging
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
 
 from dotenv import load_dotenv
 
 
 load_dotenv()
 
-logging.basicConfig(level=logging.DEBUG)
-
 DJANGO_PROJECT_NAME = os.environ["DJANGO_PROJECT_NAME"]
 
-PROJECT_DIR = os.path.join(
-    os.path.abspath(__file__),
-    "..",
-    "..",
-)
+PROJECT_DIR = str(Path(__file__).resolve().parent.parent)
 
-TOML_DIR = os.path.join(
-    PROJECT_DIR,
-    "pyproject.toml",
-)
+TOML_DIR = str(Path(PROJECT_DIR) / "pyproject.toml")
 
 
 def run_django_server() -> None:
     """
     Runs the Django development server.
 
-    Changes the directory to the Django project directory and executes the `manage.py runserver` command.
+    Executes the `manage.py runserver` command in the Django project directory.
 
     :return: None
     :rtype: None
     """
 
     logging.info("Running django server")
-    _change_directory_and_run(
+    _run_in_directory(
         ["python", "manage.py", "runserver"],
         os.path.join(PROJECT_DIR, DJANGO_PROJECT_NAME),
     )
@@ -55,17 +49,37 @@ def run_linters() -> None:
     """
     Runs code formatters: isort and black.
 
-    Changes the directory to the project directory and executes `isort .` followed by `black .` to format the code.
+    Checks the code in the project directory with `isort` and `black` in parallel.
+    If either of them reports changes, executes `isort .` followed by `black .` to format the code.
+    The formatting pass stays sequential, because black has to see the imports already sorted by isort.
 
     :return: None
     :rtype: None
     """
 
+    jobs = str(os.cpu_count() or 1)
+
+    logging.info("Checking code with isort and black")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return_codes = list(
+            executor.map(
+                _run_in_directory,
+                [
+                    ["isort", "--check-only", "--jobs", jobs, "."],
+                    ["black", "--check", "--workers", jobs, "."],
+                ],
+            )
+        )
+
+    if not any(return_codes):
+        logging.info("Code is already formatted")
+        return
+
     logging.info("Running isort")
-    _change_directory_and_run(["isort", "."])
+    _run_in_directory(["isort", "--jobs", jobs, "."])
 
     logging.info("Running black")
-    _change_directory_and_run(["black", "."])
+    _run_in_directory(["black", "--workers", jobs, "."])
 
 
 def run_mypy() -> None:
@@ -80,38 +94,43 @@ def run_mypy() -> None:
 
     logging.info("Running mypy")
     os.environ["MYPYPATH"] = PROJECT_DIR
-    _change_directory_and_run(["mypy", "--config-file", TOML_DIR, "--explicit-package-bases", "."])
+    _run_in_directory(["mypy", "--config-file", TOML_DIR, "--explicit-package-bases", "."])
 
 
-def _change_directory_and_run(_console_command: list[str], dir_to_go_to: str = PROJECT_DIR) -> None:
+def _run_in_directory(_console_command: list[str], working_dir: str = PROJECT_DIR) -> int:
     """
-    Changes the current working directory and runs a console command.
+    Runs a console command in the given working directory.
+
+    The working directory of the current process is left untouched, so commands can be run in parallel.
 
     :param _console_command: Command to run as a list of strings.
-    :param dir_to_go_to: Directory to change to before running the command. Defaults to PROJECT_DIR.
+    :param working_dir: Directory to run the command in. Defaults to PROJECT_DIR.
 
-    :return: None
-    :rtype: None
+    :return: Return code of the command.
+    :rtype: int
     """
 
-    logging.debug(f"Changing directory to {os.path.abspath(dir_to_go_to)}")
-    os.chdir(dir_to_go_to)
-    subprocess.run(_console_command)
+    logging.debug("Running %s in %s", _console_command, working_dir)
+    return subprocess.run(_console_command, cwd=working_dir).returncode
+
+
+COMMANDS: dict[str, Callable[[], None]] = {
+    "runserver": run_django_server,
+    "linters": run_linters,
+    "mypy": run_mypy,
+}
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+
     if len(sys.argv) < 2:
         logging.error("Usage: script.py [runserver | mypy | linters]")
         sys.exit(1)
 
-    # Only for Python >3.10
     console_command = sys.argv[1]
-    match console_command:
-        case "runserver":
-            run_django_server()
-        case "linters":
-            run_linters()
-        case "mypy":
-            run_mypy()
-        case _:
-            logging.error(f"Unknown command: {console_command}")
+    command_runner = COMMANDS.get(console_command)
+    if command_runner is None:
+        logging.error("Unknown command: %s", console_command)
+    else:
+        command_runner()
@@ -18,37 +18,109 @@ Key Components:
 
 import logging
 import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import (
-    asdict,
     dataclass,
+    fields,
 )
 from enum import (
     StrEnum,
     unique,
 )
-from pathlib import Path
+from functools import (
+    lru_cache,
+    partial,
+)
+from hashlib import sha256
+from http import HTTPStatus
 from typing import (
+    TYPE_CHECKING,
     Any,
     Optional,
     Union,
 )
 from urllib.parse import (
     quote,
+    quote_plus,
     urlencode,
-    urljoin,
 )
+from uuid import uuid4
 
-import requests
-from dotenv import load_dotenv
+import orjson
+from django.core.cache import cache
 
 from yandex_disk_project.settings import BASE_DIR
 
 
-load_dotenv()
+if TYPE_CHECKING:
+    import requests
+
 
 logger = logging.getLogger(__name__)
 
 
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> "requests.Session":
+    """
+    Returns the HTTP session shared by all `ResourceOperations` instances.
+
+    Views create a new `ResourceOperations` per request, so the session lives at module level to keep connections
+    to Yandex alive between requests instead of opening a new one each time.
+
+    The session is created under a lock, so concurrent first requests don't build extra sessions whose connection
+    pools would never be closed.
+
+    :return: Shared session with a connection pool sized for concurrent downloads.
+    :rtype: requests.Session
+    """
+
+    global _session
+
+    session = _session
+    if session is None:
+        with _session_lock:
+            session = _session
+            if session is None:
+                # Imported here rather than at module level: this module is loaded by every `manage.py` command
+                # through the URLConf, while `requests` is only needed once the first request to Yandex is made
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=32,
+                        pool_maxsize=32,
+                    ),
+                )
+                _session = session
+
+    return session
+
+
+@lru_cache(maxsize=128)
+def _fields_csv(field_options: tuple[StrEnum, ...]) -> str:
+    """
+    Formats fields as a CSV string, see `ResourceRequestParams.FieldOptions.csv()`.
+
+    :param field_options: Fields to format.
+
+    :type field_options: tuple[StrEnum, ...]
+
+    :return: Comma-separated field names without the leading dot.
+    :rtype: str
+    """
+
+    return ",".join(field.value[1:] for field in field_options)
+
+
 @dataclass
 class ResourceRequestParams:
     """
@@ -125,7 +197,7 @@ class ResourceRequestParams:
             """
             Returns the resolution in the format "<width>x<height>".
 
-            Only one dimension can be specified, or both. Raises ValueError for invalid formats.
+            Only one dimension can be specified, or both. Raises ValueError if neither is specified.
 
             :param width: The width of the preview in pixels.
             :param height: The height of the preview in pixels.
@@ -136,23 +208,15 @@ class ResourceRequestParams:
             :return: Resolution in "<width>x<height>" format.
             :rtype: str
 
-            :raises ValueError: If the input format is invalid.
+            :raises ValueError: If neither width nor height is specified.
             """
 
-            # fmt: off
-            # Only for Python >3.10
-            match (width, height):
-                case (int(w), int(h)):  # '<integer>, <integer>'
-                    return f"{w}x{h}"
-                case (int(w), None):    # '<integer>, None'
-                    return f"{w}x"
-                case (None, int(h)):    # 'None, <integer>'
-                    return f"x{h}"
-                case _:
-                    raise ValueError(
-                        "Invalid input format, expected '<integer>, <integer>', '<integer>, None', or 'None, <integer>'"
-                    )
-            # fmt: on
+            if width is None and height is None:
+                raise ValueError(
+                    "Invalid input format, expected '<integer>, <integer>', '<integer>, None', or 'None, <integer>'"
+                )
+
+            return f"{'' if width is None else width}x{'' if height is None else height}"
 
     @unique
     class FieldOptions(StrEnum):
@@ -221,6 +285,23 @@ class ResourceRequestParams:
         EMBEDDED_ITEMS_SIZES = EMBEDDED_ITEMS + SIZES
         EMBEDDED_ITEMS_TYPE = EMBEDDED_ITEMS + TYPE
 
+        @classmethod
+        def csv(cls, field_options: tuple["ResourceRequestParams.FieldOptions", ...]) -> str:
+            """
+            Returns the fields formatted as a CSV string accepted by the `fields` query parameter.
+
+            The result is cached, so the same set of fields is formatted only once.
+
+            :param field_options: Fields to format.
+
+            :type field_options: tuple[ResourceRequestParams.FieldOptions, ...]
+
+            :return: Comma-separated field names without the leading dot.
+            :rtype: str
+            """
+
+            return _fields_csv(field_options)
+
     FieldsType = Union[
         FieldOptions,
         tuple[FieldOptions, ...],
@@ -257,13 +338,37 @@ class ResourceRequestParams:
         :rtype: FilteredDictType
         """
 
-        result = {k: v for k, v in asdict(self).items() if v is not None}
+        # Reading the attributes directly, unlike `asdict()`, doesn't deep-copy every value just to filter it
+        result = {name: value for name in _PARAM_FIELD_NAMES if (value := getattr(self, name)) is not None}
         if isinstance(self.fields, tuple):
-            result["fields"] = ",".join(field.value[1:] for field in self.fields)
+            result["fields"] = self.FieldOptions.csv(self.fields)
 
         return result
 
 
+_PARAM_FIELD_NAMES = tuple(field.name for field in fields(ResourceRequestParams))
+_OPTIONAL_PARAM_NAMES = tuple(name for name in _PARAM_FIELD_NAMES if name not in ("public_key", "fields", "limit"))
+
+# Fields requested by default, see `ResourceOperations.get_public_resource_dict()`
+_DEFAULT_FIELDS = (
+    ResourceRequestParams.FieldOptions.NAME,
+    ResourceRequestParams.FieldOptions.PUBLIC_URL,
+    ResourceRequestParams.FieldOptions.EMBEDDED_ITEMS_NAME,
+    ResourceRequestParams.FieldOptions.EMBEDDED_ITEMS_TYPE,
+    ResourceRequestParams.FieldOptions.EMBEDDED_ITEMS_MEDIA_TYPE,
+    ResourceRequestParams.FieldOptions.EMBEDDED_ITEMS_PUBLIC_URL,
+    ResourceRequestParams.FieldOptions.PATH,
+)
+
+# Query string shared by all the requests with default options, only `public_key` is prepended to it
+_DEFAULT_QUERY_PARAMS = urlencode(
+    {
+        "fields": ResourceRequestParams.FieldOptions.csv(_DEFAULT_FIELDS),
+        "limit": ResourceRequestParams.limit,
+    }
+)
+
+
 class ResourceOperations:
     """
     Operations for interacting with Yandex Disk public resources.
@@ -286,6 +391,20 @@ class ResourceOperations:
         "files",
     )
 
+    # Resource data is revalidated with its ETag on every request, the timeout only bounds how long it's kept
+    RESOURCE_CACHE_KEY_PREFIX = "yandex_disk_public_resource:"
+    RESOURCE_CACHE_TIMEOUT = 60 * 60
+
+    # Upper bound for the number of files downloaded simultaneously
+    MAX_DOWNLOAD_WORKERS = 16
+
+    # Size of the chunks a file is written to disk in, which also bounds the memory used per download
+    DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+    def __init__(self) -> None:
+        self._session = _get_session()
+        self._download_prefix = self.YANDEX_DISK_PUBLIC_RESOURCES_BASE_URL.rstrip("/") + "/download?public_key="
+
     def get_public_resource_dict(self, params: ResourceRequestParams) -> dict[str, Any]:
         """
         Fetches resource data from Yandex Disk API based on the provided parameters.
@@ -307,21 +426,29 @@ class ResourceOperations:
 
             # Specifying these fields ensures that the response contains the minimum necessary information
             # for current application to function correctly.
-            params.fields = (
-                ResourceRequestParams.FieldOptions.NAME,
-                ResourceRequestParams.FieldOptions.PUBLIC_URL,
-                ResourceRequestParams.FieldOptions.EMBEDDED_ITEMS_NAME,
-                ResourceRequestParams.FieldOptions.EMBEDDED_ITEMS_TYPE,
-                ResourceRequestParams.FieldOptions.EMBEDDED_ITEMS_MEDIA_TYPE,
-                ResourceRequestParams.FieldOptions.EMBEDDED_ITEMS_PUBLIC_URL,
-                ResourceRequestParams.FieldOptions.PATH,
-            )
-
-        query_params = urlencode(params.prepared_dict)
-        full_url = urljoin(self.YANDEX_DISK_PUBLIC_RESOURCES_BASE_URL, f"?{query_params}")
-        logger.info(f"Full URL for fetching public resource: {full_url}")
-
-        data_json: dict[str, Any] = requests.get(full_url).json()
+            params.fields = _DEFAULT_FIELDS
+
+        if self._uses_default_query(params):
+            query_params = f"public_key={quote_plus(params.public_key)}&{_DEFAULT_QUERY_PARAMS}"
+        else:
+            query_params = urlencode(params.prepared_dict)
+        full_url = f"{self.YANDEX_DISK_PUBLIC_RESOURCES_BASE_URL}?{query_params}"
+        logger.info("Full URL for fetching public resource: %s", full_url)
+
+        # The data of a resource is cached along with its ETag, so an unchanged resource isn't downloaded and parsed
+        # again, e.g. when the file list is rendered once more after downloading files
+        cache_key = f"{self.RESOURCE_CACHE_KEY_PREFIX}{sha256(full_url.encode()).hexdigest()}"
+        cached: Optional[tuple[str, dict[str, Any]]] = cache.get(cache_key)
+
+        response = self._session.get(
+            full_url,
+            headers={"If-None-Match": cached[0]} if cached is not None else None,
+        )
+        if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            logger.info("Public resource data is not modified, using cached data.")
+            return cached[1]
+
+        data_json: dict[str, Any] = orjson.loads(response.content)
         logger.info("Successfully fetched public resource data.")
 
         # Renaming the '_embedded' key to 'embedded' to ensure compatibility with templates.
@@ -332,8 +459,34 @@ class ResourceOperations:
             data_json["embedded"] = data_json.pop("_embedded")
             logger.info("Renamed '_embedded' to 'embedded' in response data.")
 
+        # Error responses are never cached, otherwise they could be served again on a later 304
+        if response.ok and (etag := response.headers.get("ETag")):
+            cache.set(cache_key, (etag, data_json), self.RESOURCE_CACHE_TIMEOUT)
+
         return data_json
 
+    @staticmethod
+    def _uses_default_query(params: ResourceRequestParams) -> bool:
+        """
+        Returns whether all the parameters except `public_key` have their default values.
+
+        The fields are considered default when they are either not set or the ones assigned by
+        `get_public_resource_dict()`. Such parameters are encoded with the precomputed `_DEFAULT_QUERY_PARAMS`.
+
+        :param params: Parameters for the resource request.
+
+        :type params: ResourceRequestParams
+
+        :return: True if only `public_key` is customized, False otherwise.
+        :rtype: bool
+        """
+
+        return (
+            (params.fields is None or params.fields is _DEFAULT_FIELDS)
+            and params.limit == ResourceRequestParams.limit
+            and all(getattr(params, name) is None for name in _OPTIONAL_PARAM_NAMES)
+        )
+
     def download_files(self, public_key: str, files_paths: list[str]) -> None:
         """
         Downloads files from a public Yandex Disk url.
@@ -350,28 +503,108 @@ class ResourceOperations:
         :raises Exception: If there is an error downloading any of the files.
         """
 
-        new_public_key = quote(public_key.replace(" ", "+"))
-        for file_path in files_paths:
-            full_url = urljoin(
-                urljoin(self.YANDEX_DISK_PUBLIC_RESOURCES_BASE_URL, "download"),
-                f"?public_key={new_public_key}&path={quote(file_path)}",
-            )
-            logger.info(f"Full URL for downloading file: {full_url}")
+        if not files_paths:
+            return
 
-            response = requests.get(full_url)
+        files_dir = os.path.realpath(self.FILES_DIR)
 
+        # Local paths of the files grouped by their directories, the paths pointing outside `files_dir` are dropped
+        files_by_local_dir: dict[str, dict[str, str]] = {}
+        for file_path in files_paths:
             try:
-                response_content = requests.get(response.json()["href"])
+                file_local_path = self._get_file_local_path(files_dir, file_path)
+            except ValueError as e:
+                logger.error("Failed to download file %s: %s", file_path, e)
+                continue
+            files_by_local_dir.setdefault(os.path.dirname(file_local_path), {})[file_path] = file_local_path
+
+        # Create the directories if they don't exist, once per unique directory
+        files_local_paths: dict[str, str] = {}
+        for local_dir, dir_files_local_paths in files_by_local_dir.items():
+            try:
+                os.makedirs(local_dir, exist_ok=True)
+            except OSError as e:
+                for file_path in dir_files_local_paths:
+                    logger.error("Failed to download file %s: %s", file_path, e)
+                continue
+            files_local_paths.update(dir_files_local_paths)
+
+        if not files_local_paths:
+            return
 
-                # Create a directory if it doesn't exist
-                Path(self.FILES_DIR).mkdir(
-                    parents=True,
-                    exist_ok=True,
+        new_public_key = quote(public_key.replace(" ", "+"))
+        with ThreadPoolExecutor(max_workers=min(self.MAX_DOWNLOAD_WORKERS, len(files_local_paths))) as executor:
+            list(
+                executor.map(
+                    partial(self._download_one, new_public_key),
+                    files_local_paths.keys(),
+                    files_local_paths.values(),
                 )
+            )
+
+    def _download_one(self, public_key: str, file_path: str, file_local_path: str) -> None:
+        """
+        Downloads a single file from a public Yandex Disk url, streaming it straight to disk.
+
+        Errors are logged rather than raised, so a failed file doesn't interrupt the others.
+
+        :param public_key: Quoted public key for the disk or directory.
+        :param file_path: Relative path to the file to be downloaded.
+        :param file_local_path: Path to save the file to. Its directory must already exist.
+
+        :type public_key: str
+        :type file_path: str
+        :type file_local_path: str
+
+        :return: None
+        :rtype: None
+        """
+
+        full_url = f"{self._download_prefix}{public_key}&path={quote(file_path)}"
+        logger.info("Full URL for downloading file: %s", full_url)
+
+        try:
+            href = self._session.get(full_url).json()["href"]
+
+            with self._session.get(href, stream=True) as response_content:
+                response_content.raise_for_status()
+                # Let urllib3 undo a compressed transfer encoding, since the raw stream is read directly
+                response_content.raw.decode_content = True
+
+                # The file is written under a temporary name and renamed only once it's complete,
+                # so an interrupted download doesn't leave a truncated file looking like a finished one
+                temp_local_path = f"{file_local_path}.{uuid4().hex}.part"
+                try:
+                    with open(temp_local_path, "wb") as f:
+                        shutil.copyfileobj(response_content.raw, f, length=self.DOWNLOAD_CHUNK_SIZE)
+                    os.replace(temp_local_path, file_local_path)
+                except BaseException:
+                    with suppress(FileNotFoundError):
+                        os.remove(temp_local_path)
+                    raise
+            logger.info("INFO: File downloaded successfully: %s", file_local_path)
+        except Exception as e:
+            logger.error("Failed to download file %s: %s", file_path, e)
+
+    @staticmethod
+    def _get_file_local_path(files_dir: str, file_path: str) -> str:
+        """
+        Returns the local path to save a file to, making sure it stays inside the files directory.
+
+        :param files_dir: Resolved path to the files directory.
+        :param file_path: Relative path to the file on Yandex Disk, as received from the client.
+
+        :type files_dir: str
+        :type file_path: str
+
+        :return: Normalized absolute path inside the files directory.
+        :rtype: str
+
+        :raises ValueError: If the path points outside the files directory.
+        """
+
+        file_local_path = os.path.realpath(os.path.join(files_dir, file_path.lstrip("/")))
+        if file_local_path == files_dir or os.path.commonpath((files_dir, file_local_path)) != files_dir:
+            raise ValueError(f"File path is outside the files directory: {file_path}")
 
-                file_local_path = os.path.join(self.FILES_DIR, file_path[1:])
-                with open(file_local_path, "wb") as f:
-                    f.write(response_content.content)
-                logger.info(f"INFO: File downloaded successfully: {file_local_path}")
-            except Exception as e:
-                logger.error(f"Failed to download file {file_path}: {e}")
+        return file_local_path
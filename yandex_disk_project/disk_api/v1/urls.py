@@ -1,19 +1,72 @@
 """
 This module defines the URL routing for the Yandex Disk API interaction app (v1).
 It maps URL paths to specific view classes that handle requests related to Yandex Disk operations.
+
+The view classes are referenced by their dotted paths and imported on the first request they handle,
+so loading the URLConf (which Django does on every management command) doesn't import the views and their
+dependencies. As the view classes aren't imported, the URL patterns don't expose their `view_class` and attributes
+set on the `as_view()` functions, such as `csrf_exempt`.
 """
 
-from django.urls import path
+from functools import cache
+from typing import (
+    Any,
+    Callable,
+)
 
-from yandex_disk_project.disk_api.v1.views import (
-    DownloadFilesView,
-    FileListView,
-    InputLinkView,
+from django.http import (
+    HttpRequest,
+    HttpResponseBase,
 )
+from django.urls import path
+from django.utils.module_loading import import_string
+
+
+VIEWS_MODULE = "yandex_disk_project.disk_api.v1.views"
+
+
+@cache
+def _resolve_view(view_class_path: str) -> Callable[..., HttpResponseBase]:
+    """
+    Imports a class-based view by its dotted path and returns its `as_view()` function.
+
+    :param view_class_path: Dotted path to the view class.
+
+    :type view_class_path: str
+
+    :return: The view function of the class.
+    :rtype: Callable[..., HttpResponseBase]
+    """
+
+    view: Callable[..., HttpResponseBase] = import_string(view_class_path).as_view()
+
+    return view
+
+
+def _lazy_view(view_class_path: str) -> Callable[..., HttpResponseBase]:
+    """
+    Returns a view function that imports the class-based view only when it's called for the first time.
+
+    :param view_class_path: Dotted path to the view class.
+
+    :type view_class_path: str
+
+    :return: A view function delegating to the view class.
+    :rtype: Callable[..., HttpResponseBase]
+    """
+
+    def view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        return _resolve_view(view_class_path)(request, *args, **kwargs)
+
+    # Name the wrapper after the view class, so the routes stay distinguishable in `resolve()` results and tracebacks
+    view.__module__, _, view.__name__ = view_class_path.rpartition(".")
+    view.__qualname__ = view.__name__
+
+    return view
 
 
 urlpatterns = [
-    path("", InputLinkView.as_view(), name="disk_api_view"),
-    path("files/", FileListView.as_view(), name="files_list"),
-    path("download/", DownloadFilesView.as_view(), name="download_files"),
+    path("", _lazy_view(f"{VIEWS_MODULE}.InputLinkView"), name="disk_api_view"),
+    path("files/", _lazy_view(f"{VIEWS_MODULE}.FileListView"), name="files_list"),
+    path("download/", _lazy_view(f"{VIEWS_MODULE}.DownloadFilesView"), name="download_files"),
 ]
@@ -10,18 +10,20 @@ Key Components:
 """
 
 import logging
+from functools import cache
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import quote
 
+from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.http import (
     HttpRequest,
+    HttpResponse,
     HttpResponseRedirect,
 )
 from django.shortcuts import redirect
-from django.urls import (
-    reverse,
-    reverse_lazy,
-)
+from django.urls import reverse
 from django.views import View
 from django.views.generic import (
     FormView,
@@ -38,6 +40,44 @@ from yandex_disk_project.disk_api.v1.forms import PublicUrlInputForm
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _get_files_list_url() -> str:
+    """
+    Returns the URL of the file list page.
+
+    The URL is resolved on the first call and reused afterwards, unlike the result of `reverse_lazy()`,
+    which is resolved again every time it's converted to a string.
+
+    Caching is safe because the URLConf doesn't change while the project is running, and the project is served under
+    a single script prefix, which is included in the cached URL. The cache is cleared when the URL settings
+    are changed, e.g. with `override_settings()` in tests; a bare `clear_url_caches()` call doesn't clear it.
+
+    :return: The URL of the file list page.
+    :rtype: str
+    """
+
+    return reverse("files_list")
+
+
+@receiver(setting_changed)
+def _clear_files_list_url(*, setting: str, **kwargs: Any) -> None:
+    """
+    Clears the cached URL of the file list page when a setting that affects URL resolution is changed.
+
+    :param setting: Name of the changed setting.
+    :param kwargs: Additional keyword arguments sent with the signal.
+
+    :type setting: str
+    :type kwargs: Any
+
+    :return: None
+    :rtype: None
+    """
+
+    if setting in ("ROOT_URLCONF", "FORCE_SCRIPT_NAME"):
+        _get_files_list_url.cache_clear()
+
+
 class InputLinkView(FormView[PublicUrlInputForm]):
     """
     A view that handles the submission of a public URL.
@@ -48,36 +88,43 @@ class InputLinkView(FormView[PublicUrlInputForm]):
 
     template_name = "v1/public_url_input.html"
     form_class = PublicUrlInputForm
-    success_url = reverse_lazy("files_list")
 
-    def form_valid(self, form: PublicUrlInputForm) -> HttpResponseRedirect:
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         """
-        Handles the form submission when valid. Constructs a redirect URL including the public URL.
+        Handles the form submission. Constructs a redirect URL including the public URL.
 
-        :param form: An instance of PublicUrlInputForm containing the validated form data.
+        The public URL is validated with the form field alone, without instantiating and cleaning the whole form.
+        An invalid one is passed to the form, so that the validation errors are rendered as usual.
 
-        :type form: PublicUrlInputForm
+        :param request: The HTTP request object containing the public URL.
+        :param args: Additional positional arguments passed to the method.
+        :param kwargs: Additional keyword arguments passed to the method.
 
-        :return: An HTTP redirect response to the constructed URL.
-        :rtype: HttpResponseRedirect
+        :type request: HttpRequest
+        :type args: Any
+        :type kwargs: Any
+
+        :return: An HTTP redirect response to the constructed URL, or the form page with errors.
+        :rtype: HttpResponse
 
         :raises Exception: If there is an error while constructing the redirect URL.
         """
 
-        public_url = form.cleaned_data["public_url"]
-        logger.info(f"Public url received: {public_url}")
+        try:
+            public_url: str = PublicUrlInputForm.base_fields["public_url"].clean(request.POST.get("public_url"))
+        except ValidationError:
+            return super().post(request, *args, **kwargs)
+
+        logger.info("Public url received: %s", public_url)
 
         try:
-            redirect_to = urljoin(
-                self.get_success_url(),
-                f"?public_url={public_url}",
-            )
-            logger.info(f"Redirect to: {redirect_to}")
+            redirect_to = f"{_get_files_list_url()}?public_url={quote(public_url)}"
+            logger.info("Redirect to: %s", redirect_to)
         except Exception as e:
-            logger.error(f"Error while redirecting: {e}")
+            logger.error("Error while redirecting: %s", e)
             raise
 
-        return redirect(redirect_to)
+        return HttpResponseRedirect(redirect_to)
 
 
 class FileListView(TemplateView):
@@ -108,15 +155,15 @@ class FileListView(TemplateView):
         context = super().get_context_data(**kwargs)
 
         public_url: str = self.request.GET.get("public_url", "")
-        logger.info(f"Got the public URL from request: {public_url}")
+        logger.info("Got the public URL from request: %s", public_url)
 
         params = ResourceRequestParams(public_key=public_url)
 
         try:
             data_dict = ResourceOperations().get_public_resource_dict(params=params)
-            logger.info(f"Resource data received")
+            logger.info("Resource data received")
         except Exception as e:
-            logger.error(f"Error while retrieving resource data: {e}")
+            logger.error("Error while retrieving resource data: %s", e)
             raise
 
         context["data"] = data_dict
@@ -149,20 +196,17 @@ class DownloadFilesView(View):
         public_key = request.GET.get("public_key", "")
         selected_files = request.POST.getlist("selected_files")
 
-        logger.info(f"Uploading files. Public key: {public_key}, Selected files: {selected_files}")
+        logger.info("Uploading files. Public key: %s, Selected files: %s", public_key, selected_files)
         try:
             ResourceOperations().download_files(
                 public_key,
                 selected_files,
             )
-            logger.info(f"Files uploaded successfully")
+            logger.info("Files uploaded successfully")
         except Exception as e:
-            logger.error(f"Error while downloading files: {e}")
+            logger.error("Error while downloading files: %s", e)
             raise
 
-        redirect_to = urljoin(
-            reverse("files_list"),
-            f"?public_url={request.GET.get("public_url", "")}",
-        )
-        logger.info(f"Redirect to: {redirect_to}")
+        redirect_to = f"{_get_files_list_url()}?public_url={quote(request.GET.get('public_url', ''))}"
+        logger.info("Redirect to: %s", redirect_to)
         return redirect(redirect_to)